@@ -9,161 +9,363 @@ Simplified RISC-V Core Local Interrupt Controller (CLIC) implementation
 with software interrupt trigger support for testing
 """
 
+from math import isqrt
+from functools import reduce
+from operator import or_
+
 from migen import *
+from migen.genlib.cdc import MultiReg
+from migen.genlib.coding import Decoder, PriorityEncoder
 from litex.gen import *
 from litex.soc.interconnect.csr import *
 
 class CLIC(LiteXModule, AutoCSR):
-    """Simplified CLIC implementation with software trigger support"""
-    
-    def __init__(self, num_interrupts=64, num_harts=1, ipriolen=8):
+    """Simplified CLIC implementation with software trigger support
+
+    attr_mode selects how the trigger type of hardware interrupts is resolved: "dynamic" follows
+    the edge bit of clicintattr at runtime, "level_only"/"edge_only" fix it at elaboration time
+    (the edge bit is then ignored, polarity remains configurable).
+
+    pipeline_every registers the arbitration tree every N levels (None: fully combinational,
+    "auto": registered every 3 levels above 64 interrupts); the resulting latency in cycles is
+    exposed as arbiter_latency.
+
+    encoder_style selects the arbiter: "tournament" compares (active, prio, id) tuples in a tree,
+    "level_encoder" splits active_interrupt_mask per priority level and priority-encodes the lowest
+    non-empty level then its lowest id. The latter is combinational (pipeline_every must be left
+    unset) and only supported for ipriolen <= 4 (2**ipriolen levels).
+    """
+    SUPPORTED_MODES  = ("dynamic", "level_only", "edge_only")
+    SUPPORTED_STYLES = ("tournament", "level_encoder")
+
+    def __init__(self, num_interrupts=64, num_harts=1, ipriolen=8, attr_mode="dynamic", pipeline_every="auto",
+        encoder_style="tournament"):
+        assert attr_mode in self.SUPPORTED_MODES, f"Unsupported CLIC attr_mode: {attr_mode}"
+        assert encoder_style in self.SUPPORTED_STYLES, f"Unsupported CLIC encoder_style: {encoder_style}"
+        if encoder_style == "level_encoder":
+            assert ipriolen <= 4, "CLIC level_encoder requires ipriolen <= 4, use tournament"
+            assert pipeline_every in ("auto", None), "CLIC level_encoder is combinational, pipeline_every unsupported"
+            pipeline_every = None
+        assert 1 <= num_interrupts <= 4096, "CLIC supports up to 4096 interrupts (12-bit ids)"
+        if pipeline_every == "auto":
+            pipeline_every = None if num_interrupts <= 64 else 3
         self.num_interrupts = num_interrupts
         self.num_harts = num_harts
         self.ipriolen = ipriolen
+        self.attr_mode = attr_mode
+        self.pipeline_every = pipeline_every
+        self.encoder_style = encoder_style
 
         # External interrupt inputs
         self.interrupt_inputs = Signal(num_interrupts, name="interrupt_inputs")
 
         # Interrupt outputs to CPU (per HART) - VexRiscv compatible names
         self.clicInterrupt = Signal(num_harts, name="clicInterrupt")
-        self.clicInterruptId = Array([Signal(12, name=f"clicInterruptId_hart{i}")
-                                     for i in range(num_harts)])
-        self.clicInterruptPriority = Array([Signal(8, name=f"clicInterruptPriority_hart{i}")
-                                           for i in range(num_harts)])
+        # Per-hart signals are packed in one flat signal, clicInterruptId[hart] etc. are slices of it.
+        self.clicInterruptIdFlat       = Signal(12*num_harts, name="clicInterruptId")
+        self.clicInterruptPriorityFlat = Signal(8*num_harts,  name="clicInterruptPriority")
+        self.clicInterruptId       = [self.clicInterruptIdFlat[12*i:12*(i+1)]      for i in range(num_harts)]
+        self.clicInterruptPriority = [self.clicInterruptPriorityFlat[8*i:8*(i+1)] for i in range(num_harts)]
         
-        # Interrupt acknowledge inputs from CPU (per HART)
+        # Interrupt acknowledge/threshold inputs from CPU (per HART)
         self.clicClaim = Signal(num_harts, name="clicClaim")
-        self.clicThreshold = Array([Signal(8, name=f"clicThreshold_hart{i}")
-                                   for i in range(num_harts)])
+        self.clicThresholdFlat = Signal(8*num_harts, name="clicThreshold")
+        self.clicThreshold     = [self.clicThresholdFlat[8*i:8*(i+1)] for i in range(num_harts)]
 
         # Per-interrupt configuration registers
-        self.clicintattr = Array([Signal(8, name=f"clicintattr_{i}")
-                                 for i in range(num_interrupts)])
-        self.cliciprio = Array([Signal(8, name=f"cliciprio_{i}")
-                               for i in range(num_interrupts)])
-        self.clicintip = Array([Signal(name=f"clicintip_{i}")
-                               for i in range(num_interrupts)])
-        self.clicintie = Array([Signal(name=f"clicintie_{i}")
-                               for i in range(num_interrupts)])
+        # Packed as one 8-bit field per interrupt: the arbiter compares every priority in parallel
+        # so the config can't be moved to a single-read-port memory without serializing it.
+        self._attr = Signal(8*num_interrupts)
+        self._prio = Signal(8*num_interrupts)
+        self.clicintattr = [self._attr[8*i:8*(i+1)] for i in range(num_interrupts)]
+        self.cliciprio   = [self._prio[8*i:8*(i+1)] for i in range(num_interrupts)]
+
+        # Pending/enable bits are kept as wide vectors, per-interrupt views are bit slices of them
+        # (plain lists: only indexed with Python ints, runtime selection goes through part-selects)
+        self._ip = Signal(num_interrupts)
+        self._ie = Signal(num_interrupts)
+        self.clicintip = [self._ip[i] for i in range(num_interrupts)]
+        self.clicintie = [self._ie[i] for i in range(num_interrupts)]
 
         # Track number of CSR-controlled interrupts
         self.num_csr_interrupts = min(16, num_interrupts)
 
+        # Software set/clear masks of the pending bits (driven by the CSR interface)
+        self._ip_set   = Signal(num_interrupts)
+        self._ip_clear = Signal(num_interrupts)
+
         # Internal signals
-        interrupt_pending = Array([Signal(name=f"int_pending_{i}")
-                                  for i in range(num_interrupts)])
-        interrupt_enabled = Array([Signal(name=f"int_enabled_{i}")
-                                  for i in range(num_interrupts)])
-        interrupt_active = Array([Signal(name=f"int_active_{i}")
-                                 for i in range(num_interrupts)])
-
-        # Process interrupt inputs based on attributes
-        for i in range(num_interrupts):
-            # Extract trigger type from attributes
-            trig_type = Signal(2)
-            self.comb += trig_type.eq(self.clicintattr[i][:2])
-
-            # For CSR-controlled interrupts, pending bits are directly controlled
-            if i < self.num_csr_interrupts:
-                # CSR controls pending bit directly - no hardware trigger logic
-                pass
-            else:
-                # Non-CSR interrupts follow hardware inputs
-                edge_detect = Signal()
-                prev_input = Signal()
-                
-                self.sync += prev_input.eq(self.interrupt_inputs[i])
-                
-                # Edge detection logic
-                self.comb += [
-                    If(trig_type[0],  # Edge triggered
-                        If(trig_type[1],  # Negative edge
-                            edge_detect.eq(prev_input & ~self.interrupt_inputs[i])
-                        ).Else(  # Positive edge
-                            edge_detect.eq(~prev_input & self.interrupt_inputs[i])
-                        )
-                    )
-                ]
-                
-                # Update pending bits based on trigger type
-                self.sync += [
-                    If(trig_type[0],  # Edge triggered
-                        If(edge_detect,
-                            self.clicintip[i].eq(1)
-                        )
-                    ).Else(  # Level triggered
-                        If(trig_type[1],  # Negative level
-                            self.clicintip[i].eq(~self.interrupt_inputs[i])
-                        ).Else(  # Positive level
-                            self.clicintip[i].eq(self.interrupt_inputs[i])
-                        )
-                    )
-                ]
+        sw_mask          = Constant(2**self.num_csr_interrupts - 1, num_interrupts)
+        hw_mask          = Constant(2**num_interrupts - 2**self.num_csr_interrupts, num_interrupts)
+        sticky_mask      = Signal(num_interrupts)
+        sync_inputs      = Signal(num_interrupts)
+        trig_neg_mask    = Signal(num_interrupts)
+
+        # Extract polarity from attributes (bit 1: negative polarity), bit 1 of every 8-bit field
+        self.comb += trig_neg_mask.eq(self._attr[1::8])
 
-            # Determine if interrupt is active
+        # Synchronize external interrupt inputs (asynchronous to sys_clk)
+        self.specials += MultiReg(self.interrupt_inputs, sync_inputs)
+
+        # Edge/level detection, bit-parallel over all synchronized interrupt inputs. With a static
+        # attr_mode, the trigger type is known here and the unused detector is not generated.
+        if attr_mode != "level_only":
+            prev_inputs = Signal(num_interrupts)
+            pos_edge    = Signal(num_interrupts)
+            neg_edge    = Signal(num_interrupts)
+            set_mask    = Signal(num_interrupts)
+            self.sync += prev_inputs.eq(sync_inputs)
             self.comb += [
-                interrupt_pending[i].eq(self.clicintip[i]),
-                interrupt_enabled[i].eq(self.clicintie[i]),
-                interrupt_active[i].eq(interrupt_pending[i] & interrupt_enabled[i])
+                pos_edge.eq(~prev_inputs &  sync_inputs),
+                neg_edge.eq( prev_inputs & ~sync_inputs),
+                set_mask.eq((trig_neg_mask & neg_edge) | (~trig_neg_mask & pos_edge)),
             ]
+        if attr_mode != "edge_only":
+            level_val = Signal(num_interrupts)
+            self.comb += level_val.eq((~trig_neg_mask & sync_inputs) | (trig_neg_mask & ~sync_inputs))
+
+        # Sticky pending bits: CSR-controlled interrupts and edge triggered hardware interrupts.
+        if attr_mode == "dynamic":
+            # Extract trigger type from attributes (bit 0: edge triggered), bit 0 of every 8-bit field
+            trig_edge_mask = Signal(num_interrupts)
+            self.comb += trig_edge_mask.eq(self._attr[0::8])
+            self.comb += sticky_mask.eq(sw_mask | (hw_mask & trig_edge_mask))
+        elif attr_mode == "edge_only":
+            self.comb += sticky_mask.eq(sw_mask | hw_mask)
+        else:
+            self.comb += sticky_mask.eq(sw_mask)
+
+        # Update pending bits as a single vector: sticky bits are set by hardware edges and set/
+        # cleared by software, level triggered bits follow the input.
+        sticky_next = (self._ip | self._ip_set) & ~self._ip_clear
+        if attr_mode != "level_only":
+            sticky_next = sticky_next | (hw_mask & set_mask)
+        if attr_mode == "edge_only":
+            self.sync += self._ip.eq(sticky_mask & sticky_next)
+        else:
+            self.sync += self._ip.eq((sticky_mask & sticky_next) | (~sticky_mask & level_val))
+
+        # Determine if interrupt is active
+        self.active_interrupt_mask = Signal(num_interrupts)
+        self.comb += self.active_interrupt_mask.eq(self._ip & self._ie)
+
+        # Priority arbitration logic
+        # Lower priority number = higher priority, ties are won by the lowest interrupt id.
+        self.id_width = bits_for(num_interrupts - 1)
+        if encoder_style == "level_encoder":
+            active_interrupt, highest_priority, highest_id = self._level_encoder(self.active_interrupt_mask)
+            self.arbiter_latency = 0
+        else:
+            active_interrupt, highest_priority, highest_id = self._tournament(self.active_interrupt_mask)
 
-        # Priority arbitration logic (per HART)
+        # Output highest priority interrupt (per HART)
+        # The arbiter is shared by all harts, only the threshold is applied per hart at the root:
+        # a hart is interrupted when the winning priority is below its threshold (0: no masking).
+        # Since the root holds the lowest active priority, this is equivalent to masking leaves.
+        output_stmts = []
         for hart in range(num_harts):
-            # Find highest priority active interrupt
-            highest_priority = Signal(ipriolen, reset=2**ipriolen - 1)
-            highest_id = Signal(max=num_interrupts)
-            active_interrupt = Signal()
-
-            # Priority comparison logic
-            # Lower priority number = higher priority
-            for i in range(num_interrupts):
-                prio = Signal(ipriolen)
-                self.comb += prio.eq(self.cliciprio[i][:ipriolen])
-
-                self.comb += [
-                    # Check if this interrupt should preempt
-                    If(interrupt_active[i] & (prio < highest_priority),
-                        highest_priority.eq(prio),
-                        highest_id.eq(i),
-                        active_interrupt.eq(1)
-                    )
+            threshold      = self.clicThreshold[hart]
+            hart_interrupt = Signal()
+            output_stmts += [
+                hart_interrupt.eq(active_interrupt & ((threshold == 0) | (highest_priority < threshold))),
+                self.clicInterrupt[hart].eq(hart_interrupt),
+                self.clicInterruptId[hart].eq(Mux(hart_interrupt, highest_id, 0)),
+                self.clicInterruptPriority[hart].eq(Mux(hart_interrupt, highest_priority, 2**ipriolen - 1))
+            ]
+        self.comb += output_stmts
+
+    def _tournament(self, active_mask):
+        """Two-level tournament arbiter, returns the winning (active, prio, id) tuple"""
+        # Interrupt ids are built once, sized to the number of interrupts (zero-extended to the
+        # 12-bit clicInterruptId outputs).
+        id_consts = [Constant(i, self.id_width) for i in range(self.num_interrupts)]
+        leaves    = [(active_mask[i], self.cliciprio[i][:self.ipriolen], id_consts[i])
+                     for i in range(self.num_interrupts)]
+
+        # Two-level arbitration: interrupts are split in ~sqrt(N) groups, a local winner is found
+        # per group in parallel, then the group winners are arbitrated.
+        # Groups are all padded to group_size so that every path has the same number of pipeline
+        # registers.
+        group_size    = isqrt(self.num_interrupts)
+        groups        = [leaves[g:g + group_size] for g in range(0, self.num_interrupts, group_size)]
+        group_winners = []
+        for group in groups:
+            group_winner, group_depth = self._arb_tree(group, size=group_size)
+            group_winners.append(group_winner)
+        winner, depth = self._arb_tree(group_winners, level=group_depth)
+
+        # Number of cycles between an interrupt becoming active and the outputs reflecting it.
+        self.arbiter_latency = 0 if self.pipeline_every is None else depth//self.pipeline_every
+        return winner
+
+    def _level_encoder(self, active_mask):
+        """Per-priority-level encoder arbiter, returns the winning (active, prio, id) tuple"""
+        nlevels = 2**self.ipriolen
+
+        # Split active interrupts per priority level.
+        level_masks = [Signal(self.num_interrupts) for p in range(nlevels)]
+        self.comb += [level_masks[p].eq(Cat(*[active_mask[i] & (self.cliciprio[i][:self.ipriolen] == p)
+            for i in range(self.num_interrupts)])) for p in range(nlevels)]
+
+        # Find lowest non-empty priority level, then lowest interrupt id in this level. The level
+        # mask is selected with an AND-OR over the one-hot winning level (no runtime Array mux).
+        self.level_encoder = PriorityEncoder(nlevels)
+        self.level_decoder = Decoder(nlevels)
+        self.id_encoder    = PriorityEncoder(self.num_interrupts)
+        self.comb += [
+            self.level_encoder.i.eq(Cat(*[level_mask != 0 for level_mask in level_masks])),
+            self.level_decoder.i.eq(self.level_encoder.o),
+            self.level_decoder.n.eq(self.level_encoder.n),
+            self.id_encoder.i.eq(reduce(or_, [level_masks[p] & Replicate(self.level_decoder.o[p], self.num_interrupts)
+                for p in range(nlevels)])),
+        ]
+        return (~self.level_encoder.n, self.level_encoder.o, self.id_encoder.o)
+
+    def _arb_tree(self, pairs, level=0, size=None):
+        """Reduce (active, prio, id) tuples to the winning tuple through a binary tournament tree
+
+        Tree levels are numbered from level so chained trees share the same pipelining, the
+        winning tuple is returned along with the level reached at the root.
+        """
+        # Pad to the next power of two (of size, if provided) with inactive, lowest priority leaves
+        padding = (Constant(0, 1), Constant(2**self.ipriolen - 1, self.ipriolen), Constant(0, self.id_width))
+        size    = len(pairs) if size is None else size
+        pairs   = pairs + [padding]*(2**log2_int(size, need_pow2=False) - len(pairs))
+
+        # Each level compares pairs of tuples and forwards the winner, depth is log2(N). Every
+        # pipeline_every levels, winners are registered. Statements are collected locally and
+        # added to the module once.
+        comb_stmts = []
+        sync_stmts = []
+        while len(pairs) > 1:
+            level  += 1
+            winners = []
+            stmts   = comb_stmts
+            if self.pipeline_every is not None and (level % self.pipeline_every) == 0:
+                stmts = sync_stmts
+            for (a_act, a_prio, a_id), (b_act, b_prio, b_id) in zip(pairs[0::2], pairs[1::2]):
+                win_sel    = Signal()
+                win_active = Signal()
+                win_prio   = Signal(self.ipriolen)
+                win_id     = Signal(self.id_width)
+                comb_stmts += [win_sel.eq(b_act & (~a_act | (b_prio < a_prio)))]
+                stmts += [
+                    win_active.eq(a_act | b_act),
+                    win_prio.eq(Mux(win_sel, b_prio, a_prio)),
+                    win_id.eq(Mux(win_sel, b_id, a_id))
                 ]
+                winners.append((win_active, win_prio, win_id))
+            pairs = winners
+        self.comb += comb_stmts
+        self.sync += sync_stmts
+        return pairs[0], level
 
-            # Output highest priority interrupt
-            self.comb += [
-                self.clicInterrupt[hart].eq(active_interrupt),
-                self.clicInterruptId[hart].eq(highest_id),
-                self.clicInterruptPriority[hart].eq(highest_priority)
-            ]
+    def _read_part(self, vector, sel, offset, width):
+        value = Signal(width)
+        self.comb += If(sel < self.num_interrupts, value.eq(vector.part(offset, width)))
+        return value
+
+    def _read_bit(self, vector, sel):
+        return self._read_part(vector, sel, sel, 1)
+
+    def read_ip(self, sel):
+        """Pending bit of the interrupt selected at runtime by sel (0 when out of range)
+
+        clicintip is a list of bit slices only meant to be indexed with Python ints, runtime
+        selection must go through this part-select instead of building an N-way Array mux.
+        """
+        return self._read_bit(self._ip, sel)
+
+    def read_ie(self, sel):
+        """Enable bit of the interrupt selected at runtime by sel (0 when out of range)"""
+        return self._read_bit(self._ie, sel)
 
     def add_csr_interface(self, soc, base_addr=None):
-        """Add CSR interface for CLIC configuration registers"""
-        # For first few interrupts, create CSR interface
-        for i in range(self.num_csr_interrupts):
-            # Interrupt enable
-            ie = CSRStorage(1, name=f"clicintie{i}",
-                           description=f"Interrupt {i} enable")
-            setattr(self, f"_clicintie{i}", ie)
-            self.comb += self.clicintie[i].eq(ie.storage)
-
-            # Interrupt pending - use CSRStorage for software control
-            ip = CSRStorage(1, name=f"clicintip{i}",
-                           description=f"Interrupt {i} pending")
-            setattr(self, f"_clicintip{i}", ip)
-            # For CSR interrupts, pending bit is directly controlled by storage
-            self.comb += self.clicintip[i].eq(ip.storage)
-
-            # Interrupt priority
-            iprio = CSRStorage(8, name=f"cliciprio{i}",
-                              description=f"Interrupt {i} priority")
-            setattr(self, f"_cliciprio{i}", iprio)
-            self.comb += self.cliciprio[i].eq(iprio.storage)
-
-            # Interrupt attributes
-            iattr = CSRStorage(8, name=f"clicintattr{i}",
-                              description=f"Interrupt {i} attributes")
-            setattr(self, f"_clicintattr{i}", iattr)
-            self.comb += self.clicintattr[i].eq(iattr.storage)
+        """Add CSR interface for CLIC configuration registers
+
+        Per-interrupt registers are accessed indirectly: software selects an interrupt through
+        clicselect then writes its configuration to clicdata and reads it back from clicdata_r.
+        Pending bits are set/cleared by writing the interrupt id to clicip_set/clicip_clear, so
+        that a configuration write never overwrites a pending bit latched by the hardware.
+        Pending/enable bits of the software controlled interrupts are also readable packed in
+        clicip/clicie.
+        """
+        self._clicselect = CSRStorage(12, name="clicselect",
+                                      description="Interrupt selected for clicdata/clicdata_r access")
+        self._clicdata = CSRStorage(name="clicdata", description="Selected interrupt configuration (write)",
+            fields=[
+                CSRField("prio", size=8, description="Interrupt priority (lower value = higher priority)"),
+                CSRField("attr", size=8, description="Interrupt attributes (bit 0: edge triggered, bit 1: negative polarity)"),
+                CSRField("ie",   size=1, description="Interrupt enable"),
+            ])
+        self._clicdata_r = CSRStatus(name="clicdata_r", description="Selected interrupt configuration (read)",
+            fields=[
+                CSRField("prio", size=8, description="Interrupt priority (lower value = higher priority)"),
+                CSRField("attr", size=8, description="Interrupt attributes (bit 0: edge triggered, bit 1: negative polarity)"),
+                CSRField("ie",   size=1, description="Interrupt enable"),
+                CSRField("ip",   size=1, description="Interrupt pending"),
+            ])
+
+        self._clicip_set   = CSRStorage(12, name="clicip_set",
+                                        description="Write an interrupt id to set its pending bit")
+        self._clicip_clear = CSRStorage(12, name="clicip_clear",
+                                        description="Write an interrupt id to clear its pending bit")
+
+        # Packed read-only view of the software controlled interrupts, so that software can scan
+        # them with one access per register instead of one indirect access per interrupt.
+        self._clicip = CSRStatus(self.num_csr_interrupts, name="clicip",
+                                 description="Pending bits of software controlled interrupts")
+        self._clicie = CSRStatus(self.num_csr_interrupts, name="clicie",
+                                 description="Enable bits of software controlled interrupts")
+        self.comb += [
+            self._clicip.status.eq(self._ip[:self.num_csr_interrupts]),
+            self._clicie.status.eq(self._ie[:self.num_csr_interrupts]),
+        ]
+
+        sel     = self._clicselect.storage
+        sel_cfg = Signal(len(sel) + 3) # Bit offset of the selected 8-bit attr/prio field.
+        self.comb += sel_cfg.eq(sel*8)
+
+        # Write selected interrupt configuration
+        # Whole vectors are updated through a one-hot mask of the selected interrupt rather than
+        # assigned through part-selects, which Migen leaves out of the sys_rst reset logic.
+        N = self.num_interrupts
+        self.cfg_decoder = Decoder(N)
+        cfg_mask  = self.cfg_decoder.o
+        cfg_mask8 = Signal(8*N)
+        self.comb += [
+            self.cfg_decoder.i.eq(sel),
+            self.cfg_decoder.n.eq(sel >= N),
+            cfg_mask8.eq(Cat(*[Replicate(cfg_mask[i], 8) for i in range(N)])),
+        ]
+        self.sync += If(self._clicdata.re,
+            self._prio.eq((self._prio & ~cfg_mask8) | (cfg_mask8 & Replicate(self._clicdata.fields.prio, N))),
+            self._attr.eq((self._attr & ~cfg_mask8) | (cfg_mask8 & Replicate(self._clicdata.fields.attr, N))),
+            self._ie.eq((self._ie & ~cfg_mask) | (cfg_mask & Replicate(self._clicdata.fields.ie, N))),
+        )
+
+        # Pending bit set/clear writes are decoded once into set/clear masks (ignored by level
+        # triggered interrupts, whose pending bit follows the input).
+        ip_id = Signal(12)
+        self.ip_decoder = Decoder(self.num_interrupts)
+        self.comb += [
+            ip_id.eq(Mux(self._clicip_set.re, self._clicip_set.storage, self._clicip_clear.storage)),
+            self.ip_decoder.i.eq(ip_id),
+            self.ip_decoder.n.eq(ip_id >= self.num_interrupts),
+            If(self._clicip_set.re,
+                self._ip_set.eq(self.ip_decoder.o)
+            ).Elif(self._clicip_clear.re,
+                self._ip_clear.eq(self.ip_decoder.o)
+            )
+        ]
+
+        # Read back selected interrupt configuration (0 when clicselect is out of range)
+        self.comb += [
+            self._clicdata_r.fields.prio.eq(self._read_part(self._prio, sel, sel_cfg, 8)),
+            self._clicdata_r.fields.attr.eq(self._read_part(self._attr, sel, sel_cfg, 8)),
+            self._clicdata_r.fields.ie.eq(self.read_ie(sel)),
+            self._clicdata_r.fields.ip.eq(self.read_ip(sel)),
+        ]
 
     def add_to_soc(self, soc, name="clic", base_addr=None):
         """Helper method to add CLIC to a SoC"""
@@ -210,6 +210,8 @@ static inline void clint_timer_set_s(uint64_t s, uint64_t cpu_freq)
 
 #ifdef CSR_CLIC_BASE
 
+#include <clic.h>
+
 // CLIC register access functions
 // These functions provide access to CLIC registers when CLIC is enabled
 
@@ -225,349 +227,41 @@ static inline void clic_mithreshold_write(uint8_t threshold)
 	clic_mithreshold0_storage_write(threshold);
 }
 
-// Get interrupt enable for a specific interrupt (for first 16 interrupts with direct CSR access)
+// Get interrupt enable for a specific interrupt
 static inline int clic_interrupt_enabled(unsigned int interrupt)
 {
-	if (interrupt >= 16) return 0;  // Only first 16 interrupts have direct CSR access
-	
-	switch(interrupt) {
-#ifdef CSR_CLIC_CLICINTIE0_STORAGE_ADDR
-		case 0: return clic_clicintie0_storage_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIE1_STORAGE_ADDR
-		case 1: return clic_clicintie1_storage_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIE2_STORAGE_ADDR
-		case 2: return clic_clicintie2_storage_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIE3_STORAGE_ADDR
-		case 3: return clic_clicintie3_storage_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIE4_STORAGE_ADDR
-		case 4: return clic_clicintie4_storage_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIE5_STORAGE_ADDR
-		case 5: return clic_clicintie5_storage_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIE6_STORAGE_ADDR
-		case 6: return clic_clicintie6_storage_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIE7_STORAGE_ADDR
-		case 7: return clic_clicintie7_storage_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIE8_STORAGE_ADDR
-		case 8: return clic_clicintie8_storage_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIE9_STORAGE_ADDR
-		case 9: return clic_clicintie9_storage_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIE10_STORAGE_ADDR
-		case 10: return clic_clicintie10_storage_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIE11_STORAGE_ADDR
-		case 11: return clic_clicintie11_storage_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIE12_STORAGE_ADDR
-		case 12: return clic_clicintie12_storage_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIE13_STORAGE_ADDR
-		case 13: return clic_clicintie13_storage_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIE14_STORAGE_ADDR
-		case 14: return clic_clicintie14_storage_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIE15_STORAGE_ADDR
-		case 15: return clic_clicintie15_storage_read();
-#endif
-		default: return 0;
-	}
+	return clic_get_intie(interrupt);
 }
 
 // Enable a specific interrupt
 static inline void clic_interrupt_enable(unsigned int interrupt)
 {
-	if (interrupt >= 16) return;  // Only first 16 interrupts have direct CSR access
-	
-	switch(interrupt) {
-#ifdef CSR_CLIC_CLICINTIE0_STORAGE_ADDR
-		case 0: clic_clicintie0_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE1_STORAGE_ADDR
-		case 1: clic_clicintie1_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE2_STORAGE_ADDR
-		case 2: clic_clicintie2_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE3_STORAGE_ADDR
-		case 3: clic_clicintie3_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE4_STORAGE_ADDR
-		case 4: clic_clicintie4_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE5_STORAGE_ADDR
-		case 5: clic_clicintie5_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE6_STORAGE_ADDR
-		case 6: clic_clicintie6_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE7_STORAGE_ADDR
-		case 7: clic_clicintie7_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE8_STORAGE_ADDR
-		case 8: clic_clicintie8_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE9_STORAGE_ADDR
-		case 9: clic_clicintie9_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE10_STORAGE_ADDR
-		case 10: clic_clicintie10_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE11_STORAGE_ADDR
-		case 11: clic_clicintie11_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE12_STORAGE_ADDR
-		case 12: clic_clicintie12_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE13_STORAGE_ADDR
-		case 13: clic_clicintie13_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE14_STORAGE_ADDR
-		case 14: clic_clicintie14_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE15_STORAGE_ADDR
-		case 15: clic_clicintie15_storage_write(1); break;
-#endif
-	}
+	clic_set_intie(interrupt, 1);
 }
 
 // Disable a specific interrupt
 static inline void clic_interrupt_disable(unsigned int interrupt)
 {
-	if (interrupt >= 16) return;  // Only first 16 interrupts have direct CSR access
-	
-	switch(interrupt) {
-#ifdef CSR_CLIC_CLICINTIE0_STORAGE_ADDR
-		case 0: clic_clicintie0_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE1_STORAGE_ADDR
-		case 1: clic_clicintie1_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE2_STORAGE_ADDR
-		case 2: clic_clicintie2_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE3_STORAGE_ADDR
-		case 3: clic_clicintie3_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE4_STORAGE_ADDR
-		case 4: clic_clicintie4_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE5_STORAGE_ADDR
-		case 5: clic_clicintie5_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE6_STORAGE_ADDR
-		case 6: clic_clicintie6_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE7_STORAGE_ADDR
-		case 7: clic_clicintie7_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE8_STORAGE_ADDR
-		case 8: clic_clicintie8_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE9_STORAGE_ADDR
-		case 9: clic_clicintie9_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE10_STORAGE_ADDR
-		case 10: clic_clicintie10_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE11_STORAGE_ADDR
-		case 11: clic_clicintie11_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE12_STORAGE_ADDR
-		case 12: clic_clicintie12_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE13_STORAGE_ADDR
-		case 13: clic_clicintie13_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE14_STORAGE_ADDR
-		case 14: clic_clicintie14_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE15_STORAGE_ADDR
-		case 15: clic_clicintie15_storage_write(0); break;
-#endif
-	}
+	clic_set_intie(interrupt, 0);
 }
 
 // Check if interrupt is pending
 static inline int clic_interrupt_pending(unsigned int interrupt)
 {
-	if (interrupt >= 16) return 0;  // Only first 16 interrupts have direct CSR access
-	
-	switch(interrupt) {
-#ifdef CSR_CLIC_CLICINTIP0_STATUS_ADDR
-		case 0: return clic_clicintip0_status_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIP1_STATUS_ADDR
-		case 1: return clic_clicintip1_status_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIP2_STATUS_ADDR
-		case 2: return clic_clicintip2_status_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIP3_STATUS_ADDR
-		case 3: return clic_clicintip3_status_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIP4_STATUS_ADDR
-		case 4: return clic_clicintip4_status_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIP5_STATUS_ADDR
-		case 5: return clic_clicintip5_status_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIP6_STATUS_ADDR
-		case 6: return clic_clicintip6_status_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIP7_STATUS_ADDR
-		case 7: return clic_clicintip7_status_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIP8_STATUS_ADDR
-		case 8: return clic_clicintip8_status_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIP9_STATUS_ADDR
-		case 9: return clic_clicintip9_status_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIP10_STATUS_ADDR
-		case 10: return clic_clicintip10_status_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIP11_STATUS_ADDR
-		case 11: return clic_clicintip11_status_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIP12_STATUS_ADDR
-		case 12: return clic_clicintip12_status_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIP13_STATUS_ADDR
-		case 13: return clic_clicintip13_status_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIP14_STATUS_ADDR
-		case 14: return clic_clicintip14_status_read();
-#endif
-#ifdef CSR_CLIC_CLICINTIP15_STATUS_ADDR
-		case 15: return clic_clicintip15_status_read();
-#endif
-		default: return 0;
-	}
+	return clic_get_intip(interrupt);
 }
 
 // Set interrupt priority
 static inline void clic_interrupt_set_priority(unsigned int interrupt, uint8_t priority)
 {
-	if (interrupt >= 16) return;  // Only first 16 interrupts have direct CSR access
-	
-	switch(interrupt) {
-#ifdef CSR_CLIC_CLICIPRIO0_STORAGE_ADDR
-		case 0: clic_cliciprio0_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO1_STORAGE_ADDR
-		case 1: clic_cliciprio1_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO2_STORAGE_ADDR
-		case 2: clic_cliciprio2_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO3_STORAGE_ADDR
-		case 3: clic_cliciprio3_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO4_STORAGE_ADDR
-		case 4: clic_cliciprio4_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO5_STORAGE_ADDR
-		case 5: clic_cliciprio5_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO6_STORAGE_ADDR
-		case 6: clic_cliciprio6_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO7_STORAGE_ADDR
-		case 7: clic_cliciprio7_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO8_STORAGE_ADDR
-		case 8: clic_cliciprio8_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO9_STORAGE_ADDR
-		case 9: clic_cliciprio9_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO10_STORAGE_ADDR
-		case 10: clic_cliciprio10_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO11_STORAGE_ADDR
-		case 11: clic_cliciprio11_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO12_STORAGE_ADDR
-		case 12: clic_cliciprio12_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO13_STORAGE_ADDR
-		case 13: clic_cliciprio13_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO14_STORAGE_ADDR
-		case 14: clic_cliciprio14_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO15_STORAGE_ADDR
-		case 15: clic_cliciprio15_storage_write(priority); break;
-#endif
-	}
+	clic_set_intprio(interrupt, priority);
 }
 
 // Set interrupt attributes (trigger type and polarity)
 // Bits 1:0 - trigger type: 00=pos level, 01=pos edge, 10=neg level, 11=neg edge
 static inline void clic_interrupt_set_attributes(unsigned int interrupt, uint8_t attributes)
 {
-	if (interrupt >= 16) return;  // Only first 16 interrupts have direct CSR access
-	
-	switch(interrupt) {
-#ifdef CSR_CLIC_CLICINTATTR0_STORAGE_ADDR
-		case 0: clic_clicintattr0_storage_write(attributes); break;
-#endif
-#ifdef CSR_CLIC_CLICINTATTR1_STORAGE_ADDR
-		case 1: clic_clicintattr1_storage_write(attributes); break;
-#endif
-#ifdef CSR_CLIC_CLICINTATTR2_STORAGE_ADDR
-		case 2: clic_clicintattr2_storage_write(attributes); break;
-#endif
-#ifdef CSR_CLIC_CLICINTATTR3_STORAGE_ADDR
-		case 3: clic_clicintattr3_storage_write(attributes); break;
-#endif
-#ifdef CSR_CLIC_CLICINTATTR4_STORAGE_ADDR
-		case 4: clic_clicintattr4_storage_write(attributes); break;
-#endif
-#ifdef CSR_CLIC_CLICINTATTR5_STORAGE_ADDR
-		case 5: clic_clicintattr5_storage_write(attributes); break;
-#endif
-#ifdef CSR_CLIC_CLICINTATTR6_STORAGE_ADDR
-		case 6: clic_clicintattr6_storage_write(attributes); break;
-#endif
-#ifdef CSR_CLIC_CLICINTATTR7_STORAGE_ADDR
-		case 7: clic_clicintattr7_storage_write(attributes); break;
-#endif
-#ifdef CSR_CLIC_CLICINTATTR8_STORAGE_ADDR
-		case 8: clic_clicintattr8_storage_write(attributes); break;
-#endif
-#ifdef CSR_CLIC_CLICINTATTR9_STORAGE_ADDR
-		case 9: clic_clicintattr9_storage_write(attributes); break;
-#endif
-#ifdef CSR_CLIC_CLICINTATTR10_STORAGE_ADDR
-		case 10: clic_clicintattr10_storage_write(attributes); break;
-#endif
-#ifdef CSR_CLIC_CLICINTATTR11_STORAGE_ADDR
-		case 11: clic_clicintattr11_storage_write(attributes); break;
-#endif
-#ifdef CSR_CLIC_CLICINTATTR12_STORAGE_ADDR
-		case 12: clic_clicintattr12_storage_write(attributes); break;
-#endif
-#ifdef CSR_CLIC_CLICINTATTR13_STORAGE_ADDR
-		case 13: clic_clicintattr13_storage_write(attributes); break;
-#endif
-#ifdef CSR_CLIC_CLICINTATTR14_STORAGE_ADDR
-		case 14: clic_clicintattr14_storage_write(attributes); break;
-#endif
-#ifdef CSR_CLIC_CLICINTATTR15_STORAGE_ADDR
-		case 15: clic_clicintattr15_storage_write(attributes); break;
-#endif
-	}
+	clic_set_intattr(interrupt, attributes);
 }
 
 // Ibex-specific CLIC helper functions
@@ -221,6 +221,8 @@ static inline void clint_timer_set_s(uint64_t s, uint64_t cpu_freq)
 
 #ifdef CSR_CLIC_BASE
 
+#include <clic.h>
+
 // Read current CLIC interrupt ID (if available via CSR)
 #ifdef CSR_CLIC_INTERRUPT_ID_STATUS_ADDR
 static inline uint16_t vexriscv_clic_interrupt_id_read(void)
@@ -266,174 +268,21 @@ static inline void clic_mithreshold_write(uint8_t threshold)
 	(void)threshold;
 }
 
-// Enable/disable specific CLIC interrupts (first 16 with direct CSR access)
+// Enable/disable specific CLIC interrupts
 static inline void clic_interrupt_enable(unsigned int interrupt)
 {
-	if (interrupt >= 16) return;
-	
-	switch(interrupt) {
-#ifdef CSR_CLIC_CLICINTIE0_STORAGE_ADDR
-		case 0: clic_clicintie0_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE1_STORAGE_ADDR
-		case 1: clic_clicintie1_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE2_STORAGE_ADDR
-		case 2: clic_clicintie2_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE3_STORAGE_ADDR
-		case 3: clic_clicintie3_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE4_STORAGE_ADDR
-		case 4: clic_clicintie4_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE5_STORAGE_ADDR
-		case 5: clic_clicintie5_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE6_STORAGE_ADDR
-		case 6: clic_clicintie6_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE7_STORAGE_ADDR
-		case 7: clic_clicintie7_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE8_STORAGE_ADDR
-		case 8: clic_clicintie8_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE9_STORAGE_ADDR
-		case 9: clic_clicintie9_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE10_STORAGE_ADDR
-		case 10: clic_clicintie10_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE11_STORAGE_ADDR
-		case 11: clic_clicintie11_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE12_STORAGE_ADDR
-		case 12: clic_clicintie12_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE13_STORAGE_ADDR
-		case 13: clic_clicintie13_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE14_STORAGE_ADDR
-		case 14: clic_clicintie14_storage_write(1); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE15_STORAGE_ADDR
-		case 15: clic_clicintie15_storage_write(1); break;
-#endif
-	}
+	clic_set_intie(interrupt, 1);
 }
 
 static inline void clic_interrupt_disable(unsigned int interrupt)
 {
-	if (interrupt >= 16) return;
-	
-	switch(interrupt) {
-#ifdef CSR_CLIC_CLICINTIE0_STORAGE_ADDR
-		case 0: clic_clicintie0_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE1_STORAGE_ADDR
-		case 1: clic_clicintie1_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE2_STORAGE_ADDR
-		case 2: clic_clicintie2_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE3_STORAGE_ADDR
-		case 3: clic_clicintie3_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE4_STORAGE_ADDR
-		case 4: clic_clicintie4_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE5_STORAGE_ADDR
-		case 5: clic_clicintie5_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE6_STORAGE_ADDR
-		case 6: clic_clicintie6_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE7_STORAGE_ADDR
-		case 7: clic_clicintie7_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE8_STORAGE_ADDR
-		case 8: clic_clicintie8_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE9_STORAGE_ADDR
-		case 9: clic_clicintie9_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE10_STORAGE_ADDR
-		case 10: clic_clicintie10_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE11_STORAGE_ADDR
-		case 11: clic_clicintie11_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE12_STORAGE_ADDR
-		case 12: clic_clicintie12_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE13_STORAGE_ADDR
-		case 13: clic_clicintie13_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE14_STORAGE_ADDR
-		case 14: clic_clicintie14_storage_write(0); break;
-#endif
-#ifdef CSR_CLIC_CLICINTIE15_STORAGE_ADDR
-		case 15: clic_clicintie15_storage_write(0); break;
-#endif
-	}
+	clic_set_intie(interrupt, 0);
 }
 
 // Set interrupt priority
 static inline void clic_interrupt_set_priority(unsigned int interrupt, uint8_t priority)
 {
-	if (interrupt >= 16) return;
-	
-	switch(interrupt) {
-#ifdef CSR_CLIC_CLICIPRIO0_STORAGE_ADDR
-		case 0: clic_cliciprio0_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO1_STORAGE_ADDR
-		case 1: clic_cliciprio1_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO2_STORAGE_ADDR
-		case 2: clic_cliciprio2_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO3_STORAGE_ADDR
-		case 3: clic_cliciprio3_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO4_STORAGE_ADDR
-		case 4: clic_cliciprio4_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO5_STORAGE_ADDR
-		case 5: clic_cliciprio5_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO6_STORAGE_ADDR
-		case 6: clic_cliciprio6_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO7_STORAGE_ADDR
-		case 7: clic_cliciprio7_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO8_STORAGE_ADDR
-		case 8: clic_cliciprio8_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO9_STORAGE_ADDR
-		case 9: clic_cliciprio9_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO10_STORAGE_ADDR
-		case 10: clic_cliciprio10_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO11_STORAGE_ADDR
-		case 11: clic_cliciprio11_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO12_STORAGE_ADDR
-		case 12: clic_cliciprio12_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO13_STORAGE_ADDR
-		case 13: clic_cliciprio13_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO14_STORAGE_ADDR
-		case 14: clic_cliciprio14_storage_write(priority); break;
-#endif
-#ifdef CSR_CLIC_CLICIPRIO15_STORAGE_ADDR
-		case 15: clic_cliciprio15_storage_write(priority); break;
-#endif
-	}
+	clic_set_intprio(interrupt, priority);
 }
 
 // VexRiscv-specific CLIC helper functions
@@ -1415,6 +1415,7 @@ class SoC(LiteXModule, SoCCoreCompat):
         
         clic = CLIC(num_interrupts=num_interrupts, num_harts=num_harts, ipriolen=ipriolen)
         self.add_module(name=name, module=clic)
+        self.add_config("CLIC_NUM_INTERRUPTS", num_interrupts)
         
         # Add CLIC to CSR map
         clic.add_to_soc(self, name=name, base_addr=base_addr)
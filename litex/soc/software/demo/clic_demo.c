@@ -366,7 +366,7 @@ static void test_clic_csr_access(void) {
     
     /* Configure interrupt 0 */
     clic_set_intprio(0, 128);  /* Mid priority */
-    clic_set_intattr(0, 0x03); /* Edge triggered, positive */
+    clic_set_intattr(0, 0x01); /* Edge triggered, positive */
     printf("Configured interrupt 0: priority=128, edge triggered\n");
     
     /* Try to trigger interrupt 0 */
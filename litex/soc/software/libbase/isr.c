@@ -308,6 +308,9 @@ extern void clic_interrupt_handler(unsigned int id, unsigned int priority) __att
 void isr(void)
 {
     unsigned int cause = csrr(mcause);
+    /* The interrupted code may be in the middle of a clicselect/clicdata sequence: preserve
+     * clicselect across the handler. */
+    uint32_t clicselect = clic_clicselect_read();
     
     /* Check if this is an interrupt (MSB set) */
     if (cause & 0x80000000) {
@@ -319,24 +322,36 @@ void isr(void)
          */
         
         /* Find the highest priority pending interrupt */
-        unsigned int highest_priority = 255;  /* Lowest priority */
+        unsigned int highest_priority = 256;  /* Above the lowest priority (255) */
         int highest_priority_irq = -1;
+        uint32_t highest_priority_config = 0;
         unsigned int i;
         
-        /* Scan all interrupts to find the highest priority pending one */
-        /* Use CLIC_NUM_INTERRUPTS to avoid accessing invalid registers */
-        unsigned int max_interrupts = CLIC_NUM_INTERRUPTS;
-        if (max_interrupts > CONFIG_CPU_INTERRUPTS) {
-            max_interrupts = CONFIG_CPU_INTERRUPTS;
-        }
-        for (i = 0; i < max_interrupts; i++) {
-            if (clic_is_pending(i) && (clic_get_intie(i) != 0)) {
-                unsigned int priority = clic_get_intprio(i);
-                if (priority < highest_priority) {
-                    highest_priority = priority;
-                    highest_priority_irq = i;
+        /* Scan all interrupts to find the highest priority pending one (lowest id on ties).
+         * Pending/enable bits of the first CLIC_NUM_INTERRUPTS interrupts are read packed (two CSR
+         * reads), then the configuration of each of them that is active is read indirectly
+         * (clicselect write + clicdata_r read). Interrupts above have no packed view and are all
+         * read indirectly. */
+        uint32_t active = clic_get_active_mask();
+        for (i = 0; i < CLIC_NUM_HW_INTERRUPTS; i++) {
+            uint32_t config;
+            if (i < CLIC_NUM_INTERRUPTS) {
+                if (!(active & (1 << i))) {
+                    continue;
+                }
+                config = clic_read_config(i);
+            } else {
+                config = clic_read_config(i);
+                if (!(clic_clicdata_r_ie_extract(config) && clic_clicdata_r_ip_extract(config))) {
+                    continue;
                 }
             }
+            unsigned int priority = clic_clicdata_r_prio_extract(config);
+            if (priority < highest_priority) {
+                highest_priority = priority;
+                highest_priority_irq = i;
+                highest_priority_config = config;
+            }
         }
         
         /* Handle the highest priority interrupt */
@@ -346,15 +361,17 @@ void isr(void)
                 clic_interrupt_handler(highest_priority_irq, highest_priority);
             }
             /* Otherwise use the standard interrupt table */
-            else if (irq_table[highest_priority_irq].isr) {
+            else if (highest_priority_irq < CONFIG_CPU_INTERRUPTS && irq_table[highest_priority_irq].isr) {
                 irq_table[highest_priority_irq].isr();
-                /* Clear the interrupt if it's edge-triggered */
-                if (clic_get_intattr(highest_priority_irq) & CLIC_ATTR_TRIG_EDGE) {
+                /* Clear the interrupt if it's edge-triggered (clicip_clear, no clicselect access) */
+                if (clic_clicdata_r_attr_extract(highest_priority_config) & CLIC_ATTR_TRIG_EDGE) {
                     clic_clear_pending(highest_priority_irq);
                 }
             }
         }
     }
+
+    clic_clicselect_write(clicselect);
 }
 
 /***********************************/
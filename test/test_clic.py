@@ -0,0 +1,298 @@
+#
+# This file is part of LiteX.
+#
+# Copyright (c) 2025 LiteX Contributors
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from migen import *
+
+from litex.soc.cores.clic import CLIC
+
+
+class TestCLIC(unittest.TestCase):
+    def setup_interrupt(self, clic, n, prio, attr=0, ie=1, ip=1):
+        yield from clic._clicselect.write(n)
+        yield from clic._clicdata.write(prio | (attr << 8) | (ie << 16))
+        if ip is not None:
+            yield from (clic._clicip_set if ip else clic._clicip_clear).write(n)
+
+    def read_interrupt(self, clic, n):
+        yield from clic._clicselect.write(n)
+        yield
+        fields = clic._clicdata_r.fields
+        config = {}
+        for name in ["prio", "attr", "ie", "ip"]:
+            config[name] = (yield getattr(fields, name))
+        return config
+
+    def check_output(self, clic, active, id=0, prio=None):
+        self.assertEqual((yield clic.clicInterrupt[0]), active)
+        if active:
+            self.assertEqual((yield clic.clicInterruptId[0]), id)
+        if prio is not None:
+            self.assertEqual((yield clic.clicInterruptPriority[0]), prio)
+
+    def test_idle(self):
+        def generator(clic):
+            yield
+            yield from self.check_output(clic, active=0, prio=2**clic.ipriolen - 1)
+            self.assertEqual((yield clic.clicInterruptId[0]), 0)
+
+        clic = CLIC(num_interrupts=8)
+        clic.add_csr_interface(soc=None)
+        run_simulation(clic, generator(clic))
+
+    def test_highest_priority_wins(self):
+        def generator(clic):
+            yield from self.setup_interrupt(clic, 2, prio=7)
+            yield from self.setup_interrupt(clic, 5, prio=3)
+            yield from self.setup_interrupt(clic, 6, prio=9)
+            yield
+            yield from self.check_output(clic, active=1, id=5, prio=3)
+            # Disabled interrupts do not take part in the arbitration.
+            yield from self.setup_interrupt(clic, 5, prio=3, ie=0)
+            yield
+            yield from self.check_output(clic, active=1, id=2, prio=7)
+            # Neither do interrupts that are not pending.
+            yield from self.setup_interrupt(clic, 2, prio=7, ip=0)
+            yield
+            yield from self.check_output(clic, active=1, id=6, prio=9)
+
+        clic = CLIC(num_interrupts=8)
+        clic.add_csr_interface(soc=None)
+        run_simulation(clic, generator(clic))
+
+    def test_priority_tie_lowest_id_wins(self):
+        def generator(clic):
+            for n in [9, 4, 11]:
+                yield from self.setup_interrupt(clic, n, prio=1)
+            yield
+            yield from self.check_output(clic, active=1, id=4, prio=1)
+
+        # Non power of two number of interrupts exercises the tree padding.
+        clic = CLIC(num_interrupts=12)
+        clic.add_csr_interface(soc=None)
+        run_simulation(clic, generator(clic))
+
+    def wait_inputs(self):
+        # Inputs go through a 2-stage synchronizer then the pending bit register.
+        for _ in range(4):
+            yield
+
+    def test_hardware_triggers(self):
+        def generator(clic):
+            # Enable hardware interrupts 16 (positive level), 17 (positive edge) and 18 (negative edge).
+            yield clic._ie.eq(0b111 << 16)
+            yield clic.clicintattr[17].eq(0b01)
+            yield clic.clicintattr[18].eq(0b11)
+            yield clic.interrupt_inputs.eq(1 << 18)
+            yield from self.wait_inputs()
+            self.assertEqual((yield clic._ip), 0)
+            # Rising edge on 16 and 17, falling edge on 18.
+            yield clic.interrupt_inputs.eq(0b011 << 16)
+            yield from self.wait_inputs()
+            self.assertEqual((yield clic._ip), 0b111 << 16)
+            # Level triggered pending bits follow the input, edge triggered ones are sticky.
+            yield clic.interrupt_inputs.eq(0b100 << 16)
+            yield from self.wait_inputs()
+            self.assertEqual((yield clic._ip), 0b110 << 16)
+            yield from self.check_output(clic, active=1, id=17)
+
+        clic = CLIC(num_interrupts=20)
+        run_simulation(clic, generator(clic))
+
+    def test_indirect_csr_access(self):
+        def generator(clic):
+            yield from self.setup_interrupt(clic, 3, prio=0x5a, attr=0x01, ie=1, ip=1)
+            yield from self.setup_interrupt(clic, 40, prio=0x21, attr=0x03, ie=1, ip=0)
+            yield
+            self.assertEqual((yield from self.read_interrupt(clic, 3)),
+                {"prio": 0x5a, "attr": 0x01, "ie": 1, "ip": 1})
+            self.assertEqual((yield from self.read_interrupt(clic, 40)),
+                {"prio": 0x21, "attr": 0x03, "ie": 1, "ip": 0})
+            self.assertEqual((yield from self.read_interrupt(clic, 9)),
+                {"prio": 0, "attr": 0, "ie": 0, "ip": 0})
+            # Out of range selections read back as 0.
+            self.assertEqual((yield from self.read_interrupt(clic, 100)),
+                {"prio": 0, "attr": 0, "ie": 0, "ip": 0})
+            # Hardware interrupts above the software controlled range are configurable.
+            yield clic.interrupt_inputs.eq(1 << 40)
+            yield
+            yield clic.interrupt_inputs.eq(0)
+            yield from self.wait_inputs()
+            yield from self.check_output(clic, active=1, id=40, prio=0x21)
+            self.assertEqual((yield from self.read_interrupt(clic, 40))["ip"], 1)
+
+        clic = CLIC(num_interrupts=64)
+        clic.add_csr_interface(soc=None)
+        run_simulation(clic, generator(clic))
+
+    def test_static_attr_modes(self):
+        def generator(clic, expected_ip):
+            # Edge bit is set on all interrupts, but ignored with a static attr_mode.
+            for n in range(16, 20):
+                yield clic.clicintattr[n].eq(0b01)
+            yield clic.interrupt_inputs.eq(0b1111 << 16)
+            yield from self.wait_inputs()
+            yield clic.interrupt_inputs.eq(0)
+            yield from self.wait_inputs()
+            self.assertEqual((yield clic._ip), expected_ip)
+
+        for attr_mode, expected_ip in [("dynamic", 0b1111 << 16), ("level_only", 0), ("edge_only", 0b1111 << 16)]:
+            clic = CLIC(num_interrupts=20, attr_mode=attr_mode)
+            run_simulation(clic, generator(clic, expected_ip))
+
+        with self.assertRaises(AssertionError):
+            CLIC(attr_mode="unknown")
+
+    def test_pipelined_arbiter(self):
+        def generator(clic):
+            yield from self.setup_interrupt(clic, 45, prio=4)
+            yield from self.setup_interrupt(clic, 7,  prio=4)
+            yield
+            for _ in range(clic.arbiter_latency):
+                yield from self.check_output(clic, active=0)
+                yield
+            yield from self.check_output(clic, active=1, id=7, prio=4)
+
+        # 64 interrupts: 8 groups of 8, 6 tree levels registered every 2 levels.
+        clic = CLIC(num_interrupts=64, pipeline_every=2)
+        clic.add_csr_interface(soc=None)
+        self.assertEqual(clic.arbiter_latency, 3)
+        run_simulation(clic, generator(clic))
+
+        self.assertEqual(CLIC(num_interrupts=64).arbiter_latency, 0)
+        self.assertEqual(CLIC(num_interrupts=4096).arbiter_latency, 4)
+
+    def test_per_hart_threshold(self):
+        def generator(clic):
+            yield from self.setup_interrupt(clic, 3, prio=50)
+            yield from self.setup_interrupt(clic, 4, prio=128)
+            # Hart 0: no masking, hart 1: only priorities below 100, hart 2: only below 10.
+            yield clic.clicThreshold[1].eq(100)
+            yield clic.clicThreshold[2].eq(10)
+            yield
+            self.assertEqual((yield clic.clicInterrupt), 0b011)
+            for hart in range(2):
+                self.assertEqual((yield clic.clicInterruptId[hart]), 3)
+                self.assertEqual((yield clic.clicInterruptPriority[hart]), 50)
+            self.assertEqual((yield clic.clicInterruptPriority[2]), 2**clic.ipriolen - 1)
+            # Remaining interrupt is above hart 1 threshold.
+            yield from self.setup_interrupt(clic, 3, prio=50, ie=0)
+            yield
+            self.assertEqual((yield clic.clicInterrupt), 0b001)
+            self.assertEqual((yield clic.clicInterruptId[0]), 4)
+
+        clic = CLIC(num_interrupts=8, num_harts=3)
+        clic.add_csr_interface(soc=None)
+        run_simulation(clic, generator(clic))
+
+    def test_software_pending_set_clear(self):
+        def generator(clic):
+            # 40: positive edge triggered, 41: positive level triggered.
+            yield from self.setup_interrupt(clic, 40, prio=1, attr=0x01, ip=0)
+            yield from self.setup_interrupt(clic, 41, prio=2, attr=0x00, ip=0)
+            # Software can set and clear edge triggered pending bits.
+            yield from self.setup_interrupt(clic, 40, prio=1, attr=0x01, ip=1)
+            yield
+            self.assertEqual((yield clic._ip), 1 << 40)
+            yield from self.check_output(clic, active=1, id=40)
+            yield from self.setup_interrupt(clic, 40, prio=1, attr=0x01, ip=0)
+            yield
+            self.assertEqual((yield clic._ip), 0)
+            # Level triggered pending bits follow the input only.
+            yield from self.setup_interrupt(clic, 41, prio=2, attr=0x00, ip=1)
+            yield
+            self.assertEqual((yield clic._ip), 0)
+            # A hardware edge and a software clear of another interrupt in the same cycle.
+            yield from self.setup_interrupt(clic, 3, prio=0, ip=1)
+            yield clic.interrupt_inputs.eq(1 << 40)
+            yield from self.wait_inputs()
+            self.assertEqual((yield clic._ip), (1 << 40) | (1 << 3))
+            yield from self.setup_interrupt(clic, 3, prio=0, ip=0)
+            yield
+            self.assertEqual((yield clic._ip), 1 << 40)
+            # Configuration writes leave a pending bit latched by the hardware untouched.
+            yield from self.setup_interrupt(clic, 40, prio=5, attr=0x01, ip=None)
+            yield
+            self.assertEqual((yield clic._ip), 1 << 40)
+            self.assertEqual((yield from self.read_interrupt(clic, 40)),
+                {"prio": 5, "attr": 0x01, "ie": 1, "ip": 1})
+
+        clic = CLIC(num_interrupts=64)
+        clic.add_csr_interface(soc=None)
+        run_simulation(clic, generator(clic))
+
+    def test_reset(self):
+        def generator(clic):
+            yield from self.setup_interrupt(clic, 2, prio=5, attr=0x01)
+            yield
+            self.assertEqual((yield clic._ie), 1 << 2)
+            yield clic.cd_sys.rst.eq(1)
+            yield
+            yield clic.cd_sys.rst.eq(0)
+            yield
+            self.assertEqual((yield clic._ie), 0)
+            self.assertEqual((yield clic._ip), 0)
+            self.assertEqual((yield clic.cliciprio[2]), 0)
+            self.assertEqual((yield clic.clicintattr[2]), 0)
+            yield from self.check_output(clic, active=0)
+
+        clic = CLIC(num_interrupts=8)
+        clic.add_csr_interface(soc=None)
+        clic.clock_domains.cd_sys = ClockDomain("sys")
+        run_simulation(clic, generator(clic))
+
+    def test_level_encoder(self):
+        def generator(clic):
+            yield from self.setup_interrupt(clic, 12, prio=9)
+            yield from self.setup_interrupt(clic, 6,  prio=3)
+            yield from self.setup_interrupt(clic, 14, prio=3)
+            yield
+            yield from self.check_output(clic, active=1, id=6, prio=3)
+            yield from self.setup_interrupt(clic, 6,  prio=3, ie=0)
+            yield
+            yield from self.check_output(clic, active=1, id=14, prio=3)
+            yield from self.setup_interrupt(clic, 14, prio=15)
+            yield
+            yield from self.check_output(clic, active=1, id=12, prio=9)
+
+        clic = CLIC(num_interrupts=20, ipriolen=4, encoder_style="level_encoder")
+        clic.add_csr_interface(soc=None)
+        self.assertEqual(clic.encoder_style, "level_encoder")
+        run_simulation(clic, generator(clic))
+
+        # Too many priority levels, or pipelining requested: rejected.
+        with self.assertRaises(AssertionError):
+            CLIC(ipriolen=8, encoder_style="level_encoder")
+        with self.assertRaises(AssertionError):
+            CLIC(ipriolen=4, encoder_style="level_encoder", pipeline_every=2)
+
+    def test_packed_status(self):
+        def generator(clic):
+            yield from self.setup_interrupt(clic, 2, prio=1, ie=1, ip=1)
+            yield from self.setup_interrupt(clic, 9, prio=1, ie=0, ip=1)
+            yield from self.setup_interrupt(clic, 15, prio=1, ie=1, ip=0)
+            yield
+            self.assertEqual((yield from clic._clicip.read()), (1 << 2) | (1 << 9))
+            self.assertEqual((yield from clic._clicie.read()), (1 << 2) | (1 << 15))
+
+        clic = CLIC(num_interrupts=32)
+        clic.add_csr_interface(soc=None)
+        run_simulation(clic, generator(clic))
+
+    def test_runtime_read(self):
+        def generator(clic, sel, ip, ie):
+            yield from self.setup_interrupt(clic, 5, prio=1, ie=1, ip=1)
+            yield from self.setup_interrupt(clic, 6, prio=1, ie=1, ip=0)
+            for n, expected in [(5, (1, 1)), (6, (0, 1)), (7, (0, 0)), (200, (0, 0))]:
+                yield sel.eq(n)
+                yield
+                self.assertEqual(((yield ip), (yield ie)), expected)
+
+        clic = CLIC(num_interrupts=8)
+        clic.add_csr_interface(soc=None)
+        sel = Signal(12)
+        run_simulation(clic, generator(clic, sel, clic.read_ip(sel), clic.read_ie(sel)))